@@ -20,11 +20,13 @@ ALLSENTENCES = {
     '$GLGLL': pygpsnmea.sentences.gll.GLGLL}
 
 
-LATLONTIME = ('$GPRMC', '$GNRMC', '$GPGGA', '$GNGGA', '$GPGLL', '$GNGLL')
-VALIDATIONCHECKS = ('$GPRMC', '$GNRMC', '$GPGGA', '$GNGGA', '$GPGLL', '$GNGLL')
-SPEEDS = ('$GPRMC', '$GNRMC')
-ALTITUDES = ('$GPGGA', '$GNGGA')
-DATE = ('$GPRMC', '$GNRMC')
-DATETIME = ('$GPRMC', '$GNRMC')
-FIXQUALITY = ('$GPGGA', '$GNGGA')
-SATELLITESTRACKED = ('$GPGGA', '$GNGGA')
+LATLONTIME = frozenset((
+    '$GPRMC', '$GNRMC', '$GPGGA', '$GNGGA', '$GPGLL', '$GNGLL'))
+VALIDATIONCHECKS = frozenset((
+    '$GPRMC', '$GNRMC', '$GPGGA', '$GNGGA', '$GPGLL', '$GNGLL'))
+SPEEDS = frozenset(('$GPRMC', '$GNRMC'))
+ALTITUDES = frozenset(('$GPGGA', '$GNGGA'))
+DATE = frozenset(('$GPRMC', '$GNRMC'))
+DATETIME = frozenset(('$GPRMC', '$GNRMC'))
+FIXQUALITY = frozenset(('$GPGGA', '$GNGGA'))
+SATELLITESTRACKED = frozenset(('$GPGGA', '$GNGGA'))
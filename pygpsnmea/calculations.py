@@ -0,0 +1,62 @@
+"""
+calculations on the positions and times we have recorded
+"""
+
+
+def calculate_time_duration(start, end):
+    """
+    calculate how long between two times
+
+    Args:
+        start(float): the start time in seconds since the epoch
+        end(float): the end time in seconds since the epoch
+
+    Returns:
+        duration(dict): dict containing the duration in days, hours,
+                        minutes and seconds
+    """
+    totalseconds = end - start
+    days, remainder = divmod(totalseconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    duration = {
+        'days': days, 'hours': hours, 'minutes': minutes,
+        'seconds': int(seconds)}
+    return duration
+
+
+def calculate_altitudes_and_speeds(positions, altunits='M'):
+    """
+    calculate the highest, fastest and lowest values for speed and altitude
+
+    Args:
+        positions(iterable): dicts, each dict is a position report
+        altunits(str): altitude units, default is metres (M)
+
+    Returns:
+        records(dict): dictionary of stats for speeds and altitudes
+    """
+    altlabel = 'altitude ({})'.format(altunits)
+    alts = []
+    speeds = []
+    records = {}
+    for posrep in positions:
+        speed = posrep.get('speed (knots)')
+        if speed is not None:
+            speeds.append(speed)
+        altitude = posrep.get(altlabel)
+        if altitude is not None:
+            alts.append(altitude)
+    if speeds:
+        maxspeed = max(speeds)
+        avgspeed = round(sum(speeds) / len(speeds), 3)
+        records['maximum speed (knots)'] = maxspeed
+        records['average speed (knots)'] = avgspeed
+    if alts:
+        maxalt = round(max(alts), 3)
+        minalt = round(min(alts), 3)
+        altitudeclimbed = round(maxalt - minalt, 3)
+        records['maximum altitude ({})'.format(altunits)] = maxalt
+        records['minimum altitude ({})'.format(altunits)] = minalt
+        records['altitude difference ({})'.format(altunits)] = altitudeclimbed
+    return records
@@ -10,12 +10,49 @@ class GeoJsonParser():
     """
     Simple parser to generate a dictionary that can be used with json.dump(s)
 
+    Args:
+        quantize(bool): store coordinates as integers offset from the first
+                        coordinate added, default is False
+
     Attributes:
         main(dict): main dictionary to store all the points and linestrings
+        quantize(bool): whether coordinates are stored as integers
+        scale(list): size of one integer step on each axis
+        translate(list): the coordinate the integers are offset from,
+                         None until the first coordinate is added
     """
 
-    def __init__(self):
+    def __init__(self, quantize=False):
         self.main = {"type": "FeatureCollection", "features": []}
+        self.quantize = quantize
+        self.scale = [1e-7, 1e-7]
+        self.translate = None
+
+    def quantize_coordinates(self, coords):
+        """
+        convert coordinates to integers offset from the first coordinate
+
+        Note:
+            the scale and translate to turn the integers back into decimal
+            degrees are stored in self.main as 'transform' (as in CityJSON),
+            this is not part of the GeoJSON standard
+
+        Args:
+            coords(list): list of lists each containing 2 floats
+
+        Returns:
+            intcoords(list): list of lists each containing 2 integers
+        """
+        if self.translate is None:
+            self.translate = list(coords[0])
+            self.main["transform"] = {"scale": self.scale,
+                                      "translate": self.translate}
+        xscale, yscale = self.scale
+        xtranslate, ytranslate = self.translate
+        intcoords = [[round((xcoord - xtranslate) / xscale),
+                      round((ycoord - ytranslate) / yscale)]
+                     for xcoord, ycoord in coords]
+        return intcoords
 
     @staticmethod
     def create_feature_point(lon, lat, properties):
@@ -40,6 +77,11 @@ class GeoJsonParser():
         """
         create a line made up of multiple co-ordinates
 
+        Note:
+            coords is stored by reference, it is not copied, so any sequence
+            of pairs that json can serialise (e.g. a list of tuples) can be
+            passed in without building a new list for each point
+
         Args:
             coords(list): list of lists each containing 2 elements latitude
                           and longitude
@@ -62,9 +104,32 @@ class GeoJsonParser():
             lastlon(float): the longitude
             lastlat(float): the latitude
         """
+        if self.quantize:
+            [[lastlon, lastlat]] = self.quantize_coordinates(
+                [[lastlon, lastlat]])
         shippoint = self.create_feature_point(lastlon, lastlat, properties)
         self.main["features"].append(shippoint)
 
+    def add_map_points(self, coords, properties):
+        """
+        add many points to the GEOJSON at once
+
+        Note:
+            the features are built in one pass with no method call per point
+
+        Args:
+            coords(list): list of lists each containing 2 elements longitude
+                          and latitude
+            properties(list): dictionaries of info, one for each point
+        """
+        if self.quantize and coords:
+            coords = self.quantize_coordinates(coords)
+        self.main["features"].extend(
+            {"type": "Feature", "geometry": {"type": "Point",
+                                             "coordinates": coord},
+             "properties": info}
+            for coord, info in zip(coords, properties))
+
     def add_map_linestring(self, coords, properties):
         """
         add a linestring to the GEOJSON
@@ -74,6 +139,8 @@ class GeoJsonParser():
                           and longitude
             properties(dict): dictionary of info about this linestring
         """
+        if self.quantize and coords:
+            coords = self.quantize_coordinates(coords)
         linestr = self.create_feature_linestring(coords, properties)
         self.main["features"].append(linestr)
 
@@ -85,14 +152,20 @@ class GeoJsonParser():
             outputfilepath(str or path like object): where to save to
         """
         with open(outputfilepath, 'w') as geojsonfile:
-            json.dump(self.main, geojsonfile)
+            geojsonfile.write(self.get_json_string())
 
     def get_json_string(self):
         """
         get the self.main JSON as a string
 
+        Note:
+            json.dumps encodes in one call to the C encoder, unlike json.dump
+            which writes to the file piece by piece in Python,
+            the output is compact with no spaces after separators
+
         Returns:
             geojson(str): the JSON representation of self.main as a string
         """
-        geojson = json.dumps(self.main)
+        geojson = json.dumps(self.main, separators=(',', ':'),
+                             check_circular=False)
         return geojson
@@ -314,38 +314,51 @@ class BasicGUI(tkinter.Tk):
         run in another thread whist the server is running and
         get NMEA sentences from the queue and process them
 
+        Note:
+            the serial process puts lists of sentences onto the queue,
+            one list for each read from the serial device
+
         Args:
             stopevent(threading.Event): a threading stop event
         """
         while not stopevent.is_set():
             if threading.get_ident() == self.currentupdatethreadid:
-                qdata = self.mpq.get()
-                if qdata:
-                    with self.threadlock:
-                        self.tabcontrol.sentencestab.append_text(qdata)
-                        self.sentencemanager.process_sentence(qdata)
-                        try:
-                            posrep = self.sentencemanager.get_latest_position()
-                            if posrep['time'] not in self.recordedtimes:
-                                self.tabcontrol.sentencestab.append_text(qdata)
-                                latestpos = [
-                                    posrep['position no'], posrep['latitude'],
-                                    posrep['longitude'], posrep['time']]
-                                self.tabcontrol.positionstab.add_new_line(
-                                    latestpos)
-                                self.recordedtimes.append(posrep['time'])
-                                if self.livemap:
-                                    self.livemap.kmldoc.clear()
-                                    self.livemap.create_kml_header('live map')
-                                    self.livemap.add_kml_placemark(
-                                        posrep['time'], 'last known position',
-                                        str(posrep['longitude']),
-                                        str(posrep['latitude']))
-                                    self.livemap.close_kml_file()
-                                    self.livemap.write_kml_doc_file()
-                            self.tabcontrol.statustab.write_stats()
-                        except nmea.NoSuitablePositionReport:
-                            continue
+                sentences = self.mpq.get()
+                with self.threadlock:
+                    for qdata in sentences:
+                        self.update_from_sentence(qdata)
+
+    def update_from_sentence(self, qdata):
+        """
+        process a single NMEA sentence from the serial port and update the
+        displays and the live map if it gives us a new position
+
+        Args:
+            qdata(str): the NMEA sentence
+        """
+        self.tabcontrol.sentencestab.append_text(qdata)
+        self.sentencemanager.process_sentence(qdata)
+        try:
+            posrep = self.sentencemanager.get_latest_position()
+        except nmea.NoSuitablePositionReport:
+            return
+        if posrep['time'] not in self.recordedtimes:
+            self.tabcontrol.sentencestab.append_text(qdata)
+            latestpos = [
+                posrep['position no'], posrep['latitude'],
+                posrep['longitude'], posrep['time']]
+            self.tabcontrol.positionstab.add_new_line(latestpos)
+            self.recordedtimes.append(posrep['time'])
+            if self.livemap:
+                self.livemap.kmldoc.clear()
+                self.livemap.create_kml_header('live map')
+                self.livemap.add_kml_placemark(
+                    posrep['time'], 'last known position',
+                    str(posrep['longitude']),
+                    str(posrep['latitude']))
+                self.livemap.close_kml_file()
+                self.livemap.write_kml_doc_file()
+        self.tabcontrol.statustab.write_stats()
 
     def quit(self):
         """
@@ -4,12 +4,10 @@ a parser to generate Keyhole Markup Language (KML) for Google Earth
 
 import datetime
 import os
-import re
 
 
-DATETIMEREGEX = re.compile(
-    r'\d{4}/(0[1-9]|1[0-2])/(0[1-9]|1[0-9]|2[0-9]|3[01]) '
-    r'(0[0-9]|1[0-9]|2[0-3]):([0-5][0-9]):([0-5][0-9])')
+INVALIDCHARSTABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;',
+                                   '"': '&quot;', '\t': '    ', '\n': ''})
 
 
 class KMLOutputParser():
@@ -104,10 +102,10 @@ class KMLOutputParser():
         """
         self.kmldoc.append(self.kmlheader % (name))
 
-    def add_kml_placemark(self, placemarkname, description, lon, lat,
-                          altitude='0', timestamp=''):
+    def create_kml_placemark(self, placemarkname, description, lon, lat,
+                             altitude='0', timestamp=''):
         """
-        Write a placemark to the KML file (a pin on the map!)
+        format a placemark (a pin on the map!) without adding it to the doc
 
         Args:
             placemarkname(str): text that appears next to the pin on the map
@@ -116,13 +114,33 @@ class KMLOutputParser():
             lat(str): latitude in decimal degrees
             altitude(str): altitude in metres
             timestamp(str): time stamp in XML format
+
+        Returns:
+            placemark(str): the placemark as KML
         """
         placemarkname = remove_invalid_chars(placemarkname)
         coords = lon + ',' + lat + ',' + altitude
         placemark = self.placemarktemplate % (
             placemarkname, description, timestamp, lon, lat,
             altitude, coords)
-        self.kmldoc.append(placemark)
+        return placemark
+
+    def add_kml_placemark(self, placemarkname, description, lon, lat,
+                          altitude='0', timestamp=''):
+        """
+        Write a placemark to the KML file (a pin on the map!)
+
+        Args:
+            placemarkname(str): text that appears next to the pin on the map
+            description(str): text that will appear in the placemark
+            lon(str): longitude in decimal degrees
+            lat(str): latitude in decimal degrees
+            altitude(str): altitude in metres
+            timestamp(str): time stamp in XML format
+        """
+        self.kmldoc.append(self.create_kml_placemark(
+            placemarkname, description, lon, lat, altitude=altitude,
+            timestamp=timestamp))
 
     def open_folder(self, foldername):
         """
@@ -142,28 +160,55 @@ class KMLOutputParser():
         closefolderstr = "</Folder>"
         self.kmldoc.append(closefolderstr)
 
-    def add_kml_placemark_linestring(self, placemarkname, coords):
+    @staticmethod
+    def format_kml_coordinates(item):
         """
-        Write a linestring to the KML file (a line on the map!)
+        format a position as a line of KML coordinates
+
+        Args:
+            item(dict): dictionary containing Lat/Lon
+
+        Returns:
+            coordsline(str): the longitude, latitude and altitude
+                             separated by commas
+        """
+        lon = str(item['longitude'])
+        lat = str(item['latitude'])
+        try:
+            alt = str(item['altitude (M)'])
+        except KeyError:
+            alt = '0'
+        coordsline = '{},{},{}'.format(lon, lat, alt)
+        return coordsline
+
+    def create_kml_placemark_linestring(self, placemarkname, coordslines):
+        """
+        format a linestring (a line on the map!) without adding it to the doc
 
         Args:
             placemarkname(str): name of the linestring
-            coords(list): list of dicts containing Lat/Lon
+            coordslines(list): lines of coordinates as returned by
+                               format_kml_coordinates
+
+        Returns:
+            placemark(str): the linestring as KML
         """
         placemarkname = remove_invalid_chars(placemarkname)
-        newcoordslist = []
-        for item in coords:
-            lon = str(item['longitude'])
-            lat = str(item['latitude'])
-            try:
-                alt = str(item['altitude (M)'])
-            except KeyError:
-                alt = '0'
-            coordsline = '{},{},{}'.format(lon, lat, alt)
-            newcoordslist.append(coordsline)
         placemark = self.lineplacemarktemplate % (placemarkname,
-                                                  '\n'.join(newcoordslist))
-        self.kmldoc.append(placemark)
+                                                  '\n'.join(coordslines))
+        return placemark
+
+    def add_kml_placemark_linestring(self, placemarkname, coords):
+        """
+        Write a linestring to the KML file (a line on the map!)
+
+        Args:
+            placemarkname(str): name of the linestring
+            coords(iterable): dicts containing Lat/Lon
+        """
+        newcoordslist = [self.format_kml_coordinates(item) for item in coords]
+        self.kmldoc.append(self.create_kml_placemark_linestring(
+            placemarkname, newcoordslist))
 
     def close_kml_file(self):
         """
@@ -232,12 +277,7 @@ def remove_invalid_chars(xmlstring):
     Returns:
         cleanstring(str): return string with invalid chars replaced or removed
     """
-    invalidchars = {'<': '&lt;', '>': '&gt;', '"': '&quot;',
-                    '\t': '    ', '\n': ''}
-    cleanstring = xmlstring.replace('&', '&amp;')
-    for invalidchar in invalidchars:
-        cleanstring = cleanstring.replace(
-            invalidchar, invalidchars[invalidchar])
+    cleanstring = xmlstring.translate(INVALIDCHARSTABLE)
     return cleanstring
 
 
@@ -254,13 +294,12 @@ def convert_timestamp_to_kmltimestamp(timestamp):
     Returns:
         xmltimestamp(str): the timestamp in the format '%Y-%m-%dT%H:%M:%SZ'
     """
-    if DATETIMEREGEX.match(timestamp):
-        if timestamp.endswith(' (estimated)'):
-            timestamp = timestamp.rstrip(' (estimated)')
-        try:
-            dtobj = datetime.datetime.strptime(timestamp, '%Y/%m/%d %H:%M:%S')
-            kmltimestamp = dtobj.strftime('%Y-%m-%dT%H:%M:%SZ')
-        except ValueError as err:
-            raise InvalidDateTimeString('wrong') from err
-        return kmltimestamp
-    raise InvalidDateTimeString('timestamp must be %Y/%m/%d %H:%M:%S')
+    if timestamp.endswith(' (estimated)'):
+        timestamp = timestamp[:-len(' (estimated)')]
+    try:
+        dtobj = datetime.datetime.strptime(timestamp, '%Y/%m/%d %H:%M:%S')
+    except ValueError as err:
+        raise InvalidDateTimeString(
+            'timestamp must be %Y/%m/%d %H:%M:%S') from err
+    kmltimestamp = dtobj.isoformat() + 'Z'
+    return kmltimestamp
@@ -2,79 +2,18 @@
 manage the NMEA sentences
 """
 
+import array
 import collections
 import datetime
-import statistics
+import itertools
 
 import pygpsnmea.allsentences as allsentences
+import pygpsnmea.calculations as calculations
 import pygpsnmea.geojson as geojson
 import pygpsnmea.kml as kml
 import pygpsnmea.sentences.sentence as sentences
 
 
-def calculate_time_duration(start, end):
-    """
-    calculate how long between two times
-
-    Args:
-        start(datetime.datetime): the start time
-        end(datetime.datetime): the end time
-
-    Returns:
-        duration(dict): dict containing the duration in days, hours,
-                        minutes and seconds
-    """
-    timediff = end - start
-    totalseconds = timediff.total_seconds()
-    days, remainder = divmod(totalseconds, 86400)
-    hours, remainder = divmod(remainder, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    duration = {
-        'days': days, 'hours': hours, 'minutes': minutes,
-        'seconds': int(seconds)}
-    return duration
-
-
-def calculate_altitudes_and_speeds(positions, altunits='M'):
-    """
-    calculate the highest, fastest and lowest values for speed and altitude
-
-    Args:
-        positions(list): list of dicts, each dict is a position report
-        altunits(str): altitude units, default is metres (M)
-
-    Returns:
-        records(dict): dictionary of stats for speeds and altitudes
-    """
-    altlabel = 'altitude ({})'.format(altunits)
-    alts = []
-    speeds = []
-    records = {}
-    for posrep in positions:
-        try:
-            speeds.append(float(posrep['speed (knots)']))
-        except KeyError:
-            pass
-        try:
-            altfloat = float(posrep[altlabel].rstrip(' ' + altunits))
-            alts.append(altfloat)
-        except KeyError:
-            pass
-    if speeds:
-        maxspeed = max(speeds)
-        avgspeed = round(statistics.mean(speeds), 3)
-        records['maximum speed (knots)'] = maxspeed
-        records['average speed (knots)'] = avgspeed
-    if alts:
-        maxalt = round(max(alts), 3)
-        minalt = round(min(alts), 3)
-        altitudeclimbed = round(maxalt - minalt, 3)
-        records['maximum altitude ({})'.format(altunits)] = maxalt
-        records['minimum altitude ({})'.format(altunits)] = minalt
-        records['altitude difference ({})'.format(altunits)] = altitudeclimbed
-    return records
-
-
 class NoSuitablePositionReport(Exception):
     """
     raise when we have no position data
@@ -88,14 +27,17 @@ class NMEASentenceManager():
     Attributes:
         sentencetypes(collections.Counter): a count of the different sentence
                                             types we have encountered
-        positions(collections.OrderedDict): all the positions in order of which
-                                            we recieved them
-        datetimes(list): all the datetimes - used to calculate duration
+        positions(dict): all the positions in order of which we recieved them
+        datetimes(array.array): all the datetimes as seconds since the epoch
+                                - used to calculate duration
         lastdate(str): the last known date we have
         checksumerrors(int): the number of sentences with checksum errors we
                              have encountered
         positioncount(int): number of positions we have processed
+        startposition(dict): the first position in positions
+        latestposition(dict): the last position added to positions
         altitudeunits(str): what do we measure altitude as
+        altitudelabel(str): position key for altitudes in altitudeunits
     """
 
     def __init__(self):
@@ -106,71 +48,95 @@ class NMEASentenceManager():
         clear and start afresh
         """
         self.sentencetypes = collections.Counter()
-        self.positions = collections.OrderedDict()
-        self.datetimes = []
+        self.positions = {}
+        self.datetimes = array.array('d')
         self.lastdate = ''
         self.checksumerrors = 0
         self.positioncount = 0
+        self.startposition = None
+        self.latestposition = None
         self.altitudeunits = ''
+        self.altitudelabel = ''
 
     def process_sentence(self, sentence):
         """
         take an NMEA 0183 GPS sentence and process it
 
+        Note:
+            sentences read straight from a serial device can be passed in
+            as bytes, they are decoded as latin-1 once here which never
+            fails, so noise on the line is counted as a checksum error
+
         Args:
-            sentence(str): NMEA sentence
+            sentence(str or bytes): NMEA sentence
         """
-        sentencelist = sentence.split(',')
-        sentencetype = sentencelist[0]
+        if isinstance(sentence, bytes):
+            sentence = sentence.decode('latin-1')
+        sentencetype = sentence.partition(',')[0]
         errorflag = False
-        if sentencetype in allsentences.ALLSENTENCES.keys():
-            self.sentencetypes[sentencetype] += 1
-            try:
-                newsentence = \
-                    allsentences.ALLSENTENCES[sentencetype](sentencelist)
-                newpos = {}
-                if sentencetype in allsentences.VALIDATIONCHECKS:
-                    if not newsentence.valid:
-                        errorflag = True
-                if sentencetype in allsentences.DATE:
-                    if newsentence.date != self.lastdate:
-                        self.lastdate = newsentence.date
-                if sentencetype in allsentences.LATLONTIME:
-                    newpos['latitude'] = newsentence.latitude
-                    newpos['longitude'] = newsentence.longitude
-                    if self.lastdate != '':
-                        tstr = self.lastdate + ' ' + newsentence.time
-                        newdt = datetime.datetime.strptime(
-                            tstr, '%d%m%y %H%M%S.%f')
-                        timestr = newdt.strftime('%Y/%m/%d %T')
-                        newpos['time'] = timestr
-                    if sentencetype in allsentences.DATETIME:
-                        self.datetimes.append(newsentence.datetime)
-                    if sentencetype in allsentences.ALTITUDES:
-                        if self.altitudeunits == '':
-                            self.altitudeunits = newsentence.altitudeunits
-                        altlabel = \
-                            'altitude ({})'.format(newsentence.altitudeunits)
+        sentenceclass = allsentences.ALLSENTENCES.get(sentencetype)
+        if sentenceclass is None:
+            return
+        self.sentencetypes[sentencetype] += 1
+        try:
+            newsentence = sentenceclass(sentence)
+            newpos = {}
+            lastdate = self.lastdate
+            if sentencetype in allsentences.VALIDATIONCHECKS:
+                if not newsentence.valid:
+                    errorflag = True
+            if sentencetype in allsentences.DATE:
+                if newsentence.date != lastdate:
+                    lastdate = self.lastdate = newsentence.date
+            if sentencetype in allsentences.LATLONTIME:
+                newpos['latitude'] = newsentence.latitude
+                newpos['longitude'] = newsentence.longitude
+                timestr = None
+                if lastdate != '':
+                    newdt = datetime.datetime(
+                        *sentences.parse_nmea_date(lastdate),
+                        *newsentence.time)
+                    timestr = newdt.strftime('%Y/%m/%d %T')
+                    newpos['time'] = timestr
+                if sentencetype in allsentences.DATETIME:
+                    self.datetimes.append(
+                        newsentence.datetime.replace(
+                            tzinfo=datetime.timezone.utc).timestamp())
+                if sentencetype in allsentences.ALTITUDES:
+                    altitudeunits = newsentence.altitudeunits
+                    if self.altitudeunits == '':
+                        self.altitudeunits = altitudeunits
+                        self.altitudelabel = 'altitude ({})'.format(
+                            altitudeunits)
+                    if newsentence.altitude is not None:
+                        if altitudeunits == self.altitudeunits:
+                            altlabel = self.altitudelabel
+                        else:
+                            altlabel = 'altitude ({})'.format(altitudeunits)
                         newpos[altlabel] = newsentence.altitude
-                    if sentencetype in allsentences.SPEEDS:
+                if sentencetype in allsentences.SPEEDS:
+                    if newsentence.speed is not None:
                         newpos['speed (knots)'] = newsentence.speed
-                    if sentencetype in allsentences.FIXQUALITY:
-                        newpos['fix quality'] = newsentence.fixquality
-                    if sentencetype in allsentences.SATELLITESTRACKED:
-                        newpos['satellites tracked'] = \
-                            newsentence.satellitestracked
-                    if not errorflag:
-                        try:
-                            self.positions[timestr].update(newpos)
-                        except KeyError:
-                            self.positioncount += 1
-                            newpos['position no'] = self.positioncount
-                            self.positions[timestr] = newpos
-            except sentences.CheckSumFailed:
-                self.checksumerrors += 1
-                errorflag = True
-            except ValueError:
-                errorflag = True
+                if sentencetype in allsentences.FIXQUALITY:
+                    newpos['fix quality'] = newsentence.fixquality
+                if sentencetype in allsentences.SATELLITESTRACKED:
+                    newpos['satellites tracked'] = \
+                        newsentence.satellitestracked
+                if not errorflag and timestr is not None:
+                    posrep = self.positions.setdefault(timestr, newpos)
+                    if posrep is newpos:
+                        self.positioncount += 1
+                        newpos['position no'] = self.positioncount
+                        if self.startposition is None:
+                            self.startposition = newpos
+                        self.latestposition = newpos
+                    else:
+                        posrep.update(newpos)
+        except sentences.CheckSumFailed:
+            self.checksumerrors += 1
+            errorflag = True
+        except ValueError:
+            errorflag = True
 
     def get_latest_position(self):
         """
@@ -180,13 +146,11 @@ class NMEASentenceManager():
             NoSuitablePositionReport: if no position found
 
         Returns:
-            self.positions(dict): last item in self.positions
+            self.latestposition(dict): last item in self.positions
         """
-        try:
-            positionlist = list(self.positions.values())
-            return positionlist[len(positionlist) - 1]
-        except (IndexError, AttributeError) as err:
-            raise NoSuitablePositionReport('Unknown') from err
+        if self.latestposition is None:
+            raise NoSuitablePositionReport('Unknown')
+        return self.latestposition
 
     def get_start_position(self):
         """
@@ -196,13 +160,11 @@ class NMEASentenceManager():
             NoSuitablePositionReport: if no position found
 
         Returns:
-            self.positions(dict): first item in self.positions
+            self.startposition(dict): first item in self.positions
         """
-        try:
-            positionlist = list(self.positions.values())
-            return positionlist[0]
-        except (IndexError, AttributeError) as err:
-            raise NoSuitablePositionReport('Unknown') from err
+        if self.startposition is None:
+            raise NoSuitablePositionReport('Unknown')
+        return self.startposition
 
     def stats(self):
         """
@@ -222,10 +184,11 @@ class NMEASentenceManager():
         stats['sentence types'] = self.sentencetypes
         stats['start position'] = firstpos
         stats['end position'] = lastpos
-        stats['duration'] = calculate_time_duration(
-            self.datetimes[0], self.datetimes[len(self.datetimes) - 1])
-        stats['speeds and altitudes'] = calculate_altitudes_and_speeds(
-            list(self.positions.values()), altunits=self.altitudeunits)
+        stats['duration'] = calculations.calculate_time_duration(
+            self.datetimes[0], self.datetimes[-1])
+        stats['speeds and altitudes'] = \
+            calculations.calculate_altitudes_and_speeds(
+                self.positions.values(), altunits=self.altitudeunits)
         return stats
 
     def create_kml_map(self, outputfile, verbose=True):
@@ -243,24 +206,28 @@ class NMEASentenceManager():
         except NoSuitablePositionReport as err:
             print('unable to make KML map')
             raise err
-        poslist = list(self.positions.values())
         kmlmap = kml.KMLOutputParser(outputfile)
         kmlmap.create_kml_header('test')
-        kmlmap.add_kml_placemark_linestring('linestring', poslist)
+        lastposno = len(self.positions)
+        coordslines = []
+        points = []
+        for posno, posrep in enumerate(self.positions.values(), start=1):
+            coordslines.append(kmlmap.format_kml_coordinates(posrep))
+            if verbose and 1 < posno < lastposno:
+                kmltime = kml.convert_timestamp_to_kmltimestamp(posrep['time'])
+                posdesc = kmlmap.format_kml_placemark_description(posrep)
+                points.append(kmlmap.create_kml_placemark(
+                    str(posno), posdesc, str(posrep['longitude']),
+                    str(posrep['latitude']), timestamp=kmltime))
+        kmlmap.kmldoc.append(kmlmap.create_kml_placemark_linestring(
+            'linestring', coordslines))
         startdesc = kmlmap.format_kml_placemark_description(start)
         kmlmap.add_kml_placemark(
             'start', startdesc, str(start['longitude']),
             str(start['latitude']))
         if verbose:
             kmlmap.open_folder('points')
-            poscount = 2
-            for posrep in poslist[1:len(self.positions) - 1]:
-                kmltime = kml.convert_timestamp_to_kmltimestamp(posrep['time'])
-                posdesc = kmlmap.format_kml_placemark_description(posrep)
-                kmlmap.add_kml_placemark(
-                    str(poscount), posdesc, str(posrep['longitude']),
-                    str(posrep['latitude']), timestamp=kmltime)
-                poscount += 1
+            kmlmap.kmldoc.extend(points)
             kmlmap.close_folder()
         enddesc = kmlmap.format_kml_placemark_description(end)
         kmlmap.add_kml_placemark(
@@ -284,22 +251,21 @@ class NMEASentenceManager():
         except NoSuitablePositionReport as err:
             print('unable to make GEOJSON map')
             raise err
-        poslist = list(self.positions.values())
         geojsonmap = geojson.GeoJsonParser()
-        coords = [[pos['latitude'], pos['longitude']] for pos in poslist]
+        coords = [(pos['latitude'], pos['longitude'])
+                  for pos in self.positions.values()]
         stats = self.stats()
         linestrproperties = {
             'total positions': stats['total positions'],
             'duration': stats['duration']}
         geojsonmap.add_map_linestring(coords, linestrproperties)
-        geojsonmap.add_map_point(start, start['longitude'],
-                                 start['latitude'])
+        points = [start]
         if verbose:
-            for posrep in poslist[1:len(self.positions) - 1]:
-                geojsonmap.add_map_point(
-                    posrep, posrep['longitude'], posrep['latitude'])
-        geojsonmap.add_map_point(end, end['longitude'],
-                                 end['latitude'])
+            points.extend(itertools.islice(
+                self.positions.values(), 1, len(self.positions) - 1))
+        points.append(end)
+        geojsonmap.add_map_points(
+            [[pos['longitude'], pos['latitude']] for pos in points], points)
         geojsonmap.save_to_file(outputfile)
 
     def create_positions_table(self):
@@ -313,10 +279,7 @@ class NMEASentenceManager():
         positiontable = []
         headers = ['latitude', 'longitude', 'time']
         positiontable.append(headers)
-        for posrep in list(self.positions.values()):
-            line = []
-            line.append(posrep['latitude'])
-            line.append(posrep['longitude'])
-            line.append(posrep['time'])
-            positiontable.append(line)
+        for posrep in self.positions.values():
+            positiontable.append(
+                [posrep['latitude'], posrep['longitude'], posrep['time']])
         return positiontable
@@ -27,23 +27,30 @@ class GGA(sentence.NMEASentence):
     11 - height of geoid (mean sea level) above WGS84 ellipsoid
     """
 
+    __slots__ = ('latitude', 'longitude', 'time', 'fixquality',
+                 'satellitestracked', 'altitude', 'altitudeunits', 'valid')
+
     fix = {'0': 'invalid', '1': 'GPS', '2': 'DGPS', '3': 'PPS',
            '4': 'Real Time Kinematic', '5': 'Float RTK',
            '6': 'Estimated (dead reckoning)',
            '7': 'Manual input mode', '8': 'Simulation mode'}
 
-    def __init__(self, sentencelist, errorcheck=True):
-        super().__init__(sentencelist)
+    def __init__(self, nmeatext, errorcheck=True):
+        super().__init__(nmeatext, errorcheck=errorcheck)
+        sentencelist = self.sentencelist
         self.latitude, self.longitude = \
             sentence.latlon_decimaldegrees(
-                self.sentencelist[2], self.sentencelist[3],
-                self.sentencelist[4], self.sentencelist[5])
-        self.time = self.sentencelist[1]
-        self.fixquality = self.fix[self.sentencelist[6]]
-        self.satellitestracked = self.sentencelist[7]
-        self.altitude = self.sentencelist[9]
-        self.altitudeunits = self.sentencelist[10]
-        self.valid = bool(self.sentencelist[6] in (
+                sentencelist[2], sentencelist[3],
+                sentencelist[4], sentencelist[5])
+        self.time = sentence.parse_nmea_time(sentencelist[1])
+        self.fixquality = self.fix.get(sentencelist[6], 'invalid')
+        self.satellitestracked = sentencelist[7]
+        if sentencelist[9]:
+            self.altitude = float(sentencelist[9])
+        else:
+            self.altitude = None
+        self.altitudeunits = sentencelist[10] or 'M'
+        self.valid = bool(sentencelist[6] in (
             '1', '2', '3', '4', '5', '6'))
 
 
@@ -52,14 +59,20 @@ class GPGGA(GGA):
     GPS GGA sentence
     """
 
+    __slots__ = ()
+
 
 class GNGGA(GGA):
     """
     Global Navigation Satellite System GGA sentence
     """
 
+    __slots__ = ()
+
 
 class GLGGA(GGA):
     """
     GLONASS GGA sentence
     """
+
+    __slots__ = ()
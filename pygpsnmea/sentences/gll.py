@@ -21,14 +21,17 @@ class GLL(sentence.NMEASentence):
     6 - status A = data valid, V = data not valid
     """
 
-    def __init__(self, sentencelist, errorcheck=True):
-        super().__init__(sentencelist)
+    __slots__ = ('latitude', 'longitude', 'time', 'valid')
+
+    def __init__(self, nmeatext, errorcheck=True):
+        super().__init__(nmeatext, errorcheck=errorcheck)
+        sentencelist = self.sentencelist
         self.latitude, self.longitude = \
             sentence.latlon_decimaldegrees(
-                self.sentencelist[1], self.sentencelist[2],
-                self.sentencelist[3], self.sentencelist[4])
-        self.time = self.sentencelist[5]
-        self.valid = bool(self.sentencelist[6] == 'A')
+                sentencelist[1], sentencelist[2],
+                sentencelist[3], sentencelist[4])
+        self.time = sentence.parse_nmea_time(sentencelist[5])
+        self.valid = bool(sentencelist[6] == 'A')
 
 
 class GPGLL(GLL):
@@ -36,14 +39,20 @@ class GPGLL(GLL):
     GPS GLL sentence
     """
 
+    __slots__ = ()
+
 
 class GNGLL(GLL):
     """
     Global Navigation Satellite System GLL sentence
     """
 
+    __slots__ = ()
+
 
 class GLGLL(GLL):
     """
     GLONASS GLL sentence
     """
+
+    __slots__ = ()
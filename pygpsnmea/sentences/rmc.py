@@ -29,19 +29,26 @@ class RMC(sentence.NMEASentence):
     12 - checksum
     """
 
-    def __init__(self, sentencelist, errorcheck=True):
-        super().__init__(sentencelist)
+    __slots__ = ('latitude', 'longitude', 'time', 'date', 'datetime',
+                 'valid', 'speed', 'cog')
+
+    def __init__(self, nmeatext, errorcheck=True):
+        super().__init__(nmeatext, errorcheck=errorcheck)
+        sentencelist = self.sentencelist
         self.latitude, self.longitude = \
             sentence.latlon_decimaldegrees(
-                self.sentencelist[3], self.sentencelist[4],
-                self.sentencelist[5], self.sentencelist[6])
-        self.time = self.sentencelist[1]
-        self.date = self.sentencelist[9]
-        self.datetime = datetime.datetime.strptime(
-            '{} {}'.format(self.time, self.date), '%H%M%S.%f %d%m%y')
-        self.valid = bool(self.sentencelist[2] == 'A')
-        self.speed = self.sentencelist[7]
-        self.cog = self.sentencelist[8]
+                sentencelist[3], sentencelist[4],
+                sentencelist[5], sentencelist[6])
+        self.time = sentence.parse_nmea_time(sentencelist[1])
+        self.date = sentencelist[9]
+        self.datetime = datetime.datetime(
+            *sentence.parse_nmea_date(self.date), *self.time)
+        self.valid = bool(sentencelist[2] == 'A')
+        if sentencelist[7]:
+            self.speed = float(sentencelist[7])
+        else:
+            self.speed = None
+        self.cog = sentencelist[8]
 
 
 class GPRMC(RMC):
@@ -49,14 +56,20 @@ class GPRMC(RMC):
     GPS RMC sentence
     """
 
+    __slots__ = ()
+
 
 class GNRMC(RMC):
     """
     Global Navigation Satellite System RMC sentence
     """
 
+    __slots__ = ()
+
 
 class GLRMC(RMC):
     """
     GLONASS RMC sentence
     """
+
+    __slots__ = ()
@@ -2,6 +2,23 @@
 contains the base class for all NMEA sentences
 """
 
+import functools
+import operator
+import re
+
+
+CHECKSUMPATTERN = r'([^*]*)\*([0-9A-Fa-f]{2})'
+NMEACHECKSUMREGEX = re.compile(r'\$' + CHECKSUMPATTERN)
+NMEACHECKSUMBYTESREGEX = re.compile(NMEACHECKSUMREGEX.pattern.encode('ascii'))
+HEX2INT = {
+    first + second: int(first + second, 16)
+    for first in '0123456789abcdefABCDEF'
+    for second in '0123456789abcdefABCDEF'}
+HEX2INT.update({hexstr.encode('ascii'): value
+                for hexstr, value in list(HEX2INT.items())})
+LATSIGNS = {'N': 1.0, 'S': -1.0}
+LONSIGNS = {'E': 1.0, 'W': -1.0}
+
 
 def latlon_decimaldegrees(nmealat, latchar, nmealon, lonchar):
     """
@@ -23,49 +40,106 @@ def latlon_decimaldegrees(nmealat, latchar, nmealon, lonchar):
         latdeg(float): the latitude in decimal degrees
         londeg(float): the longitude in decimal degrees
     """
-    nmealon = float(nmealon)
-    nmealat = float(nmealat)
-    londegwhole = int(nmealon/100)
-    londecdeg = (nmealon - londegwhole * 100)/60
-    londeg = londegwhole + londecdeg
-    if lonchar == 'W':
-        londeg = (-1)*londeg
-    latdegwhole = int(nmealat/100)
-    latdecdeg = (nmealat - latdegwhole * 100)/60
-    latdeg = latdegwhole + latdecdeg
-    if latchar == 'S':
-        latdeg = (-1)*latdeg
+    londegwhole, lonminutes = divmod(float(nmealon), 100)
+    londeg = LONSIGNS.get(lonchar, 1.0) * (londegwhole + lonminutes/60)
+    latdegwhole, latminutes = divmod(float(nmealat), 100)
+    latdeg = LATSIGNS.get(latchar, 1.0) * (latdegwhole + latminutes/60)
     return latdeg, londeg
 
 
-def calculate_nmea_checksum(sentence, start='$', seperator=','):
+def parse_nmea_time(nmeatime):
+    """
+    Converts the nmea time into a tuple of integers
+
+    Args:
+        nmeatime(str): time in the format hhmmss.microseconds
+
+    Raises:
+        ValueError: if the time is not made up of digits or there are less
+                    than 6 digits before the decimal point
+
+    Returns:
+        timetuple(tuple): hours, minutes, seconds and microseconds
+    """
+    if len(nmeatime.partition('.')[0]) < 6:
+        raise ValueError('NMEA time must be hhmmss - {}'.format(nmeatime))
+    hours = int(nmeatime[0:2])
+    minutes = int(nmeatime[2:4])
+    seconds = int(nmeatime[4:6])
+    if len(nmeatime) > 7:
+        microseconds = int(nmeatime[7:13].ljust(6, '0'))
+    else:
+        microseconds = 0
+    return hours, minutes, seconds, microseconds
+
+
+@functools.lru_cache(maxsize=32)
+def parse_nmea_date(nmeadate):
+    """
+    Converts the nmea date into a tuple of integers
+
+    Note:
+        the year only has 2 digits, it is assumed to be in the 21st century
+        the date only changes once a day so recent results are cached
+
+    Args:
+        nmeadate(str): date in the format ddmmyy
+
+    Raises:
+        ValueError: if the date is not made up of 6 digits
+
+    Returns:
+        datetuple(tuple): year, month and day
+    """
+    if len(nmeadate) != 6:
+        raise ValueError('NMEA date must be ddmmyy - {}'.format(nmeadate))
+    return 2000 + int(nmeadate[4:6]), int(nmeadate[2:4]), int(nmeadate[0:2])
+
+
+def calculate_nmea_checksum(sentence, start='$'):
     """
     XOR each char with the last, compare the last 2 characters
     with the computed checksum
 
+    Note:
+        a single regex match finds the data between the start character and
+        the * and the 2 hex digits of the checksum after it,
+        the hex digits are converted with a lookup table not int()
+        if the sentence is already bytes it is checked without re-encoding
+
     Args:
-        sentence(str): the ais sentence as a string
+        sentence(str or bytes): the ais sentence
         start(str): the start of the sentence default = $
-        separator(str): character that separates the parts of the nmea sentence
-                        default = ,
 
     Returns:
         True: if calculated checksum = checksum at the end of the sentence
         False: if checksums do not match
     """
-    try:
-        sentencelist = sentence.rstrip().split(seperator)
-        csum = hex(int(sentencelist[len(sentencelist) - 1].split('*')[1], 16))
-        start = sentence.find(start) + 1
-        end = sentence.find('*')
-        data = sentence[start:end]
-        chksum = 0
-        for char in data:
-            chksum ^= ord(char)
-        chksum = hex(int(chksum))
-    except IndexError:
-        return False
-    return bool(csum == chksum)
+    if isinstance(sentence, bytes):
+        if start == '$':
+            match = NMEACHECKSUMBYTESREGEX.search(sentence)
+        else:
+            match = re.search(
+                re.escape(start.encode('ascii')) +
+                CHECKSUMPATTERN.encode('ascii'), sentence)
+        if match is None:
+            return False
+        data = match.group(1)
+        if not data.isascii():
+            return False
+    else:
+        if start == '$':
+            match = NMEACHECKSUMREGEX.search(sentence)
+        else:
+            match = re.search(re.escape(start) + CHECKSUMPATTERN, sentence)
+        if match is None:
+            return False
+        try:
+            data = match.group(1).encode('ascii')
+        except UnicodeEncodeError:
+            return False
+    chksum = functools.reduce(operator.xor, data, 0)
+    return bool(HEX2INT[match.group(2)] == chksum)
 
 
 class CheckSumFailed(Exception):
@@ -79,19 +153,24 @@ class NMEASentence():
     the base class for NMEA sentences
 
     Args:
-        sentencelist(list): the NMEA sentence parts as a list
+        nmeatext(str): the NMEA sentence as a string
         errorcheck(bool): if set to true, the checksum will be calculated to
                           ensure the sentence is correctly formed
                           default is True
+
+    Attributes:
+        sentencelist(list): the NMEA sentence parts as a list
+        type(str): the sentence name e.g. $GPRMC
+        checksumok(bool): result of the checksum, only set if errorcheck
     """
 
-    def __init__(self, sentencelist, errorcheck=True):
-        self.sentencelist = sentencelist
-        nmeatext = ','.join(sentencelist)
+    __slots__ = ('sentencelist', 'type', 'checksumok')
+
+    def __init__(self, nmeatext, errorcheck=True):
+        self.sentencelist = nmeatext.split(',')
         self.type = self.sentencelist[0]
         if errorcheck:
             self.checksumok = calculate_nmea_checksum(nmeatext)
             if not self.checksumok:
                 raise CheckSumFailed(
-                    'nmea sentence checksum failed - {}'.format(
-                        ','.join(self.sentencelist)))
+                    'nmea sentence checksum failed - {}'.format(nmeatext))
@@ -5,6 +5,8 @@ a simple program to log data from a serial port
 
 import logging
 import logging.handlers
+import queue
+import signal
 
 
 import serial
@@ -23,12 +25,22 @@ class SerialInterface():
         interface(serial.Serial): the actual object to talk with
                                   the serial device
         seriallog(logging.logger): logger to log NMEA sentences
+        loghandler(logging.handlers.QueueHandler): puts the logged NMEA
+                                                   sentences onto a queue
+        loglistener(logging.handlers.QueueListener): writes the logged NMEA
+                                                     sentences to file in a
+                                                     background thread
+        readbuffer(bytearray): bytes read from the serial device that don't
+                               make up a complete line yet
     """
 
     def __init__(self, serialdevice, baudrate, logpath=False):
         self.interface = serial.Serial(serialdevice, baudrate)
         self.seriallog = logging.getLogger('serialport')
         self.seriallog.setLevel(logging.INFO)
+        self.loghandler = None
+        self.loglistener = None
+        self.readbuffer = bytearray()
         if logpath:
             self.setup_file_handler(logpath)
 
@@ -36,6 +48,11 @@ class SerialInterface():
         """
         setup the logger to save NMEA sentences to a file
 
+        Note:
+            the logger only puts records on a queue, the file is written
+            by a QueueListener thread so disk writes and log rotation
+            don't hold up reading from the serial port
+
         Args:
             outputpath(str): path to save to
         """
@@ -44,24 +61,60 @@ class SerialInterface():
         rotatinghandler = logging.handlers.RotatingFileHandler(
             outputpath, maxBytes=1000000)
         rotatinghandler.setFormatter(logformatter)
-        self.seriallog.addHandler(rotatinghandler)
+        logqueue = queue.Queue(-1)
+        self.loghandler = logging.handlers.QueueHandler(logqueue)
+        self.seriallog.addHandler(self.loghandler)
         self.seriallog.propagate = False
+        self.loglistener = logging.handlers.QueueListener(
+            logqueue, rotatinghandler)
+        self.loglistener.start()
+
+    def stop_logging(self):
+        """
+        stop the log listener thread, writing out any sentences still
+        waiting on the log queue
+        """
+        if self.loghandler:
+            self.seriallog.removeHandler(self.loghandler)
+            self.loghandler = None
+        if self.loglistener:
+            self.loglistener.stop()
+            self.loglistener = None
 
     def read_from_serial(self, dataqueue):
         """
         read data from the serial port constantly
-        decode it to ASCII and log it
+        decode it and log it
+
+        Note:
+            we read everything waiting on the port at once and split it into
+            lines ourselves, readline() reads a single byte at a time
+            all the complete sentences from each read are put onto the
+            queue together as a list
+            lines are decoded as latin-1 which never fails, any noise on the
+            line will fail the NMEA checksum later on
+            lines are only split on \n, not str.splitlines() which would also
+            split on noise bytes such as \x0c or \x85
 
         Args:
             dataqueue(multiprocessing.Queue): queue to put data onto
         """
-        while True:
-            try:
-                sentence = self.interface.readline().decode('ascii')
-                self.seriallog.info(sentence.rstrip())
-                dataqueue.put(sentence)
-            except UnicodeDecodeError:
-                continue
+        readbuffer = self.readbuffer
+        try:
+            while True:
+                readbuffer += self.interface.read(
+                    max(1, self.interface.in_waiting))
+                lastlineend = readbuffer.rfind(b'\n') + 1
+                if not lastlineend:
+                    continue
+                lines = readbuffer[:lastlineend].decode('latin-1').split('\n')
+                del readbuffer[:lastlineend]
+                sentences = [line + '\n' for line in lines[:-1]]
+                for sentence in sentences:
+                    self.seriallog.info(sentence.rstrip())
+                dataqueue.put(sentences)
+        finally:
+            self.stop_logging()
 
 
 def test_serial_interface_connection(serialdevice, baudrate):
@@ -87,15 +140,37 @@ def test_serial_interface_connection(serialdevice, baudrate):
         raise err
 
 
+def exit_on_sigterm(signum, frame):
+    """
+    signal handler to turn SIGTERM into SystemExit, so finally blocks run
+    when the process is terminated
+
+    Args:
+        signum(int): the signal number
+        frame(frame): the stack frame that was interrupted
+    """
+    raise SystemExit(0)
+
+
 def mp_serial_interface(dataqueue, device, baud, logpath=None):
     """
     meant to be run in another process by the GUI
 
+    Note:
+        the GUI stops this process with terminate() which sends SIGTERM,
+        this is turned into SystemExit so read_from_serial can stop logging
+        and write out any sentences still on the log queue
+        the GUI stops reading dataqueue when it terminates this process, so
+        sentences still waiting to go onto dataqueue are thrown away rather
+        than blocking the exit
+
     Args:
         dataqueue(multiprocessing.Queue): queue to put data onto
         device(str): the path to the serial devices
         baud(int): baud rate of serial device
         logpath(str): path for the file handler to setup logging to
     """
+    dataqueue.cancel_join_thread()
+    signal.signal(signal.SIGTERM, exit_on_sigterm)
     serialint = SerialInterface(device, baud, logpath=logpath)
     serialint.read_from_serial(dataqueue)
@@ -4,14 +4,24 @@ Unit Tests for PY GPS NMEA
 
 import collections
 import datetime
+import multiprocessing
+import time
+import types
 import unittest
+import unittest.mock
 import xml.etree.ElementTree
 
+import pygpsnmea.calculations as calculations
 import pygpsnmea.geojson as geojson
 import pygpsnmea.kml as kml
 import pygpsnmea.nmea as nmea
 import pygpsnmea.sentences.sentence as sentence
 
+try:
+    import pygpsnmea.serialinterface as serialinterface
+except ImportError:
+    serialinterface = None
+
 
 GNRMCSENTENCES = [
     '$GNRMC,135734.00,A,5152.423142,N,00210.276118,W,0.0,,100221,4.2,W,A*0D',
@@ -43,32 +53,26 @@ class NMEASentenceTests(unittest.TestCase):
     tests related to the interpretation of GPS NMEA 0183 sentences
     """
 
-    def test_correct_nmea_checksum(self):
+    def test_nmea_checksum(self):
         """
-        feed in an NMEA 0183 sentence and calculate its checksum
-        checksum should be correct and True
+        feed in NMEA 0183 sentences and calculate their checksums
+        an incomplete sentence with no checksum should return False as we
+        are unable to calculate the checksum as there isn't one!
+        non ASCII noise should fail even if the checksum matches it
         """
-        testsentence = ('$GPRMC,152904.000,A,4611.1699,N,00117.8182,'
-                        'W,000.00,0.0,240714,,,E*46')
-        self.assertTrue(sentence.calculate_nmea_checksum(testsentence))
-
-    def test_incorrect_nmea_checksum(self):
-        """
-        feed in an NMEA 0183 sentence and calculate its checksum
-        checksum should be incorrect and False
-        """
-        testsentence = ('$GPRMC,152904.000,A,4611.1699,N,00117.8182,'
-                        'W,000.00,0.0,240714,,,E*48')
-        self.assertFalse(sentence.calculate_nmea_checksum(testsentence))
-
-    def test_incomplete_sentence(self):
-        """
-        feed in an incomplete NMEA sentence with no checksum
-        should return False as we are unable to calculate the checksum as there
-        isn't one!
-        """
-        testsentence = '$GPRMC,165629.00,V,,'
-        self.assertFalse(sentence.calculate_nmea_checksum(testsentence))
+        testsentences = [
+            ('$GPRMC,152904.000,A,4611.1699,N,00117.8182,'
+             'W,000.00,0.0,240714,,,E*46', True),
+            ('$GPRMC,152904.000,A,4611.1699,N,00117.8182,'
+             'W,000.00,0.0,240714,,,E*48', False),
+            ('$GPRMC,165629.00,V,,', False),
+            (b'$GPRMC,152904.000,A,4611.1699,N,00117.8182,'
+             b'W,000.00,0.0,240714,,,E*46', True),
+            (b'$GP\xb5*A2', False)]
+        for testsentence, expected in testsentences:
+            with self.subTest(testsentence=testsentence):
+                self.assertIs(
+                    sentence.calculate_nmea_checksum(testsentence), expected)
 
 
 class NMEASentenceManagerTests(unittest.TestCase):
@@ -108,7 +112,7 @@ class NMEASentenceManagerTests(unittest.TestCase):
         start = self.sentencemanager.get_start_position()
         expected = {
             'latitude': 51.87371903333333, 'longitude': -2.1712686333333333,
-            'time': '2021/02/10 13:57:34', 'speed (knots)': '0.0',
+            'time': '2021/02/10 13:57:34', 'speed (knots)': 0.0,
             'position no': 1}
         self.assertEqual(start, expected)
 
@@ -120,7 +124,7 @@ class NMEASentenceManagerTests(unittest.TestCase):
         start = self.sentencemanager.get_latest_position()
         expected = {
             'latitude': 51.87045136666667, 'longitude': -2.1722006166666668,
-            'time': '2021/02/10 14:07:21', 'speed (knots)': '0.0',
+            'time': '2021/02/10 14:07:21', 'speed (knots)': 0.0,
             'position no': 12}
         self.assertEqual(start, expected)
 
@@ -160,6 +164,46 @@ class NMEASentenceManagerTests(unittest.TestCase):
         test['positions after'] = self.sentencemanager.positioncount
         self.assertEqual(test, expected)
 
+    def test_bytes_sentence(self):
+        """
+        sentences read from a serial device may be passed in as bytes
+        """
+        self.sentencemanager.process_sentence(GNRMCSENTENCES[0].encode())
+        start = self.sentencemanager.get_start_position()
+        self.assertEqual(start['time'], '2021/02/10 13:57:34')
+
+    def test_bytes_sentence_noise(self):
+        """
+        non ASCII noise in a sentence passed in as bytes should be counted
+        as a checksum error
+        """
+        self.sentencemanager.process_sentence(
+            GNRMCSENTENCES[0].encode().replace(b'5152', b'51\xb52'))
+        self.assertEqual(self.sentencemanager.sentencetypes['$GNRMC'], 1)
+        self.assertEqual(self.sentencemanager.checksumerrors, 1)
+        self.assertEqual(self.sentencemanager.positioncount, 0)
+
+    def test_position_before_date(self):
+        """
+        a GGA sentence has no date, so if we haven't had a date from an RMC
+        sentence yet the position cannot be timestamped and is not stored
+        """
+        self.sentencemanager.process_sentence(
+            '$GPGGA,135734.00,5152.423142,N,00210.276118,W,1,08,0.9,545.4,M,'
+            '46.9,M,,*7A')
+        self.assertEqual(self.sentencemanager.positioncount, 0)
+
+    def test_gga_no_fix(self):
+        """
+        a GGA sentence with an empty fix quality field should not raise
+        an exception and should not be stored as a position
+        """
+        self.sentencemanager.process_sentence(GNRMCSENTENCES[0])
+        self.sentencemanager.process_sentence(
+            '$GPGGA,135800.00,5152.423142,N,00210.276118,W,,08,0.9,560.1,M,'
+            '46.9,M,,*41')
+        self.assertEqual(self.sentencemanager.positioncount, 1)
+
     def test_empty_stats(self):
         """
         test stats on an empty sentence manager, only checksum errors and
@@ -182,13 +226,13 @@ class NMEASentenceManagerTests(unittest.TestCase):
                 'latitude': 51.87371903333333,
                 'longitude': -2.1712686333333333,
                 'time': '2021/02/10 13:57:34',
-                'speed (knots)': '0.0',
+                'speed (knots)': 0.0,
                 'position no': 1},
             'end position': {
                 'latitude': 51.87045136666667,
                 'longitude': -2.1722006166666668,
                 'time': '2021/02/10 14:07:21',
-                'speed (knots)': '0.0',
+                'speed (knots)': 0.0,
                 'position no': 12},
             'duration': {
                 'days': 0.0, 'hours': 0.0, 'minutes': 9.0, 'seconds': 47},
@@ -207,9 +251,12 @@ class MiscTests(unittest.TestCase):
         test calculating the time duration
         """
         expected = {'days': 6.0, 'hours': 5.0, 'minutes': 49.0, 'seconds': 30}
-        start = datetime.datetime(2021, 2, 14, 12, 25, 30)
-        end = datetime.datetime(2021, 2, 20, 18, 15)
-        duration = nmea.calculate_time_duration(start, end)
+        start = datetime.datetime(
+            2021, 2, 14, 12, 25, 30,
+            tzinfo=datetime.timezone.utc).timestamp()
+        end = datetime.datetime(
+            2021, 2, 20, 18, 15, tzinfo=datetime.timezone.utc).timestamp()
+        duration = calculations.calculate_time_duration(start, end)
         self.assertEqual(expected, duration)
 
     def test_convert_to_decimal_degrees(self):
@@ -225,12 +272,94 @@ class MiscTests(unittest.TestCase):
         expected = (51.87045136666667, -2.1722006166666668)
         self.assertEqual(result, expected)
 
+    def test_parse_nmea_date(self):
+        """
+        test converting the NMEA date into year, month and day
+        dates that are not 6 digits should raise ValueError
+        """
+        result = sentence.parse_nmea_date('100221')
+        expected = (2021, 2, 10)
+        self.assertEqual(result, expected)
+        for testinput in ('10022', '1002211'):
+            with self.subTest(testinput=testinput):
+                with self.assertRaises(ValueError):
+                    sentence.parse_nmea_date(testinput)
+
+    def test_parse_nmea_time(self):
+        """
+        test converting the NMEA time into hours, minutes, seconds
+        and microseconds
+        times with less than 6 digits before the decimal point should raise
+        ValueError
+        """
+        result = sentence.parse_nmea_time('140721.25')
+        expected = (14, 7, 21, 250000)
+        self.assertEqual(result, expected)
+        for testinput in ('12345', '12345.00'):
+            with self.subTest(testinput=testinput):
+                with self.assertRaises(ValueError):
+                    sentence.parse_nmea_time(testinput)
+
+
+@unittest.skipIf(serialinterface is None, 'pyserial is not installed')
+@unittest.skipIf('fork' not in multiprocessing.get_all_start_methods(),
+                 'the fake serial device needs the fork start method')
+class SerialInterfaceTests(unittest.TestCase):
+    """
+    tests for reading from a serial device
+    """
+
+    def test_terminate_with_full_queue(self):
+        """
+        the GUI stops reading the queue when it terminates the reader
+        process, the reader should still exit even if the queue is full
+        """
+        mpcontext = multiprocessing.get_context('fork')
+        dataqueue = mpcontext.Queue()
+        with unittest.mock.patch('serial.Serial') as mockserial:
+            mockserial.return_value.in_waiting = 0
+            mockserial.return_value.read.return_value = (
+                GNRMCSENTENCES[0].encode() + b'\r\n') * 1000
+            reader = mpcontext.Process(
+                target=serialinterface.mp_serial_interface,
+                args=[dataqueue, '/dev/ttyUSB0', 9600])
+            reader.start()
+        dataqueue.get(timeout=10)
+        time.sleep(0.5)
+        reader.terminate()
+        reader.join(timeout=10)
+        stillalive = reader.is_alive()
+        if stillalive:
+            reader.kill()
+            reader.join()
+        dataqueue.close()
+        self.assertFalse(stillalive)
+
 
 class GeoJSONTests(unittest.TestCase):
     """
     tests for GEOJSON output
+
+    Attributes:
+        EXPECTEDPOINT(types.MappingProxyType): the expected point feature
+        EXPECTEDLINESTRING(types.MappingProxyType): the expected linestring
+                                                    feature
     """
 
+    EXPECTEDPOINT = types.MappingProxyType(
+        {"type": "Feature",
+         "geometry": {"type": "Point",
+                      "coordinates": [-3.055468, 53.815964]},
+         "properties": {'Name': 'Blackpool Tower', 'Height(m)': 158}})
+    EXPECTEDLINESTRING = types.MappingProxyType(
+        {"type": "Feature",
+         "geometry": {"type": "LineString",
+                      "coordinates": [
+                          [-4.328763333333334, 53.864983333333335],
+                          [-3.6327133333333332, 53.90793333333333],
+                          [-3.3356966666666668, 53.90606666666667]]},
+         "properties": {'description': 'coords in Morcambe Bay'}})
+
     def setUp(self):
         self.parser = geojson.GeoJsonParser()
 
@@ -241,12 +370,16 @@ class GeoJSONTests(unittest.TestCase):
         testinfo = {'Name': 'Blackpool Tower', 'Height(m)': 158}
         testlat = 53.815964
         testlon = -3.055468
-        expected = {"type": "Feature",
-                    "geometry": {"type": "Point",
-                                 "coordinates": [testlon, testlat]},
-                    "properties": testinfo}
         returned = self.parser.create_feature_point(testlon, testlat, testinfo)
-        self.assertEqual(expected, returned)
+        self.assertEqual(self.EXPECTEDPOINT, returned)
+
+    def test_add_map_points(self):
+        """
+        Tests adding many points to the map at once.
+        """
+        testinfo = {'Name': 'Blackpool Tower', 'Height(m)': 158}
+        self.parser.add_map_points([[-3.055468, 53.815964]], [testinfo])
+        self.assertEqual(self.parser.main['features'], [self.EXPECTEDPOINT])
 
     def test_feature_linestring(self):
         """
@@ -257,11 +390,29 @@ class GeoJSONTests(unittest.TestCase):
             [-3.6327133333333332, 53.90793333333333],
             [-3.3356966666666668, 53.90606666666667]]
         testinfo = {'description': 'coords in Morcambe Bay'}
-        expected = {"type": "Feature", "geometry": {"type": "LineString",
-                                                    "coordinates": positions},
-                    "properties": testinfo}
         returned = self.parser.create_feature_linestring(positions, testinfo)
-        self.assertEqual(expected, returned)
+        self.assertEqual(self.EXPECTEDLINESTRING, returned)
+        self.assertIs(returned['geometry']['coordinates'], positions)
+
+    def test_quantized_linestring(self):
+        """
+        Tests adding a line on the map with integer coordinates.
+        """
+        positions = [
+            [-4.328763333333334, 53.864983333333335],
+            [-3.6327133333333332, 53.90793333333333],
+            [-3.3356966666666668, 53.90606666666667]]
+        parser = geojson.GeoJsonParser(quantize=True)
+        parser.add_map_linestring(positions, {})
+        transform = parser.main['transform']
+        self.assertEqual(transform['translate'], positions[0])
+        returned = parser.main['features'][0]['geometry']['coordinates']
+        self.assertEqual(returned[0], [0, 0])
+        for intcoord, coord in zip(returned, positions):
+            for intval, val, scale, translate in zip(
+                    intcoord, coord, transform['scale'],
+                    transform['translate']):
+                self.assertAlmostEqual(intval * scale + translate, val, 7)
 
 
 class KMLTimingTests(unittest.TestCase):
@@ -287,71 +438,22 @@ class KMLTimingTests(unittest.TestCase):
         teststring = kml.convert_timestamp_to_kmltimestamp(testinput)
         self.assertEqual(expected, teststring)
 
-    def test_unsuitable_timestamp_regex_fail(self):
-        """
-        test a timestamp that doesn't match the regex
-
-        Note:
-            change this when i come up with a better regex for datetimes
-        """
-        testinput = '2020-06-02 19:03:17'
-        with self.assertRaises(kml.InvalidDateTimeString):
-            kml.convert_timestamp_to_kmltimestamp(testinput)
-
-    def test_unsuitable_timestamp_regex_fail_month(self):
-        """
-        test a timestamp with an invalid month
-
-        Note:
-            change this when i come up with a better regex for datetimes
-        """
-        testinput = '2020/16/06 20:34:09'
-        with self.assertRaises(kml.InvalidDateTimeString):
-            kml.convert_timestamp_to_kmltimestamp(testinput)
-
-    def test_unsuitable_timestamp_regex_fail_day(self):
-        """
-        test a timestamp with an invalid day
-
-        Note:
-            change this when i come up with a better regex for datetimes
-        """
-        testinput = '2020/11/62 20:34:09'
-        with self.assertRaises(kml.InvalidDateTimeString):
-            kml.convert_timestamp_to_kmltimestamp(testinput)
-
-    def test_unsuitable_timestamp_regex_fail_hour(self):
-        """
-        test a timestamp with an invalid hour
-
-        Note:
-            change this when i come up with a better regex for datetimes
-        """
-        testinput = '2020/11/30 26:34:09'
-        with self.assertRaises(kml.InvalidDateTimeString):
-            kml.convert_timestamp_to_kmltimestamp(testinput)
-
-    def test_unsuitable_timestamp_regex_fail_minutes(self):
-        """
-        test a timestamp with an invalid minutes field
-
-        Note:
-            change this when i come up with a better regex for datetimes
-        """
-        testinput = '2020/11/30 17:67:09'
-        with self.assertRaises(kml.InvalidDateTimeString):
-            kml.convert_timestamp_to_kmltimestamp(testinput)
-
-    def test_unsuitable_timestamp_regex_fail_seconds(self):
-        """
-        test a timestamp with an invalid seconds field
-
-        Note:
-            change this when i come up with a better regex for datetimes
-        """
-        testinput = '2020/11/30 17:02:78'
-        with self.assertRaises(kml.InvalidDateTimeString):
-            kml.convert_timestamp_to_kmltimestamp(testinput)
+    def test_unsuitable_timestamps(self):
+        """
+        test timestamps in the wrong format or with an invalid month, day,
+        hour, minutes or seconds field
+        """
+        testinputs = [
+            '2020-06-02 19:03:17',
+            '2020/16/06 20:34:09',
+            '2020/11/62 20:34:09',
+            '2020/11/30 26:34:09',
+            '2020/11/30 17:67:09',
+            '2020/11/30 17:02:78']
+        for testinput in testinputs:
+            with self.subTest(testinput=testinput):
+                with self.assertRaises(kml.InvalidDateTimeString):
+                    kml.convert_timestamp_to_kmltimestamp(testinput)
 
 
 class KMLTests(unittest.TestCase):